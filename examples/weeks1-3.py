@@ -146,14 +146,11 @@ print("Answer=" + str(answer_num))  # cannot concatenate int directly; convert t
 
 # Design and implement nested conditionals (Week 3) with simple robustness
 score_str = input("Enter a score from 0 to 100: ")
-# Light robustness: check content before converting (still only using covered ideas)
+# Light robustness: check content before converting.
 # We will treat non-digits as unexpected input and skip grading.
-all_digits = True
-for ch in score_str:
-    if not ("0" <= ch <= "9"):
-        all_digits = False
-
-if all_digits and (score_str != ""):
+# isdecimal() is one more string method (like .strip()/.lower(), but not covered yet):
+# it is True only when every character is a digit, and False for "" too.
+if score_str.isdecimal():
     score = int(score_str)
     if 0 <= score <= 100:
         # nested conditionals
@@ -19,7 +19,7 @@ colors = ["blue", "green", "red", "purple"]  # list of strings
 print("Random color pick:", random.choice(colors))  # random.choice with import
 
 mood = input("How are you feeling today? ").strip().lower()  # saved
-print(input("What should I call you today? "))  # unsaved input call
+input("(Press Enter to continue...) ")  # unsaved input call
 
 if "good" in mood or "great" in mood:  # 'in' + 'or'
     print("Yay!")
@@ -35,7 +35,7 @@ if "good" in mood or "great" in mood:  # 'in' + 'or'
 else:
     print("Hope things improve.")
     pet = input("Cat or dog? ").strip().lower()
-    if pet == "cat" and ("a" in pet):  # 'and' + in + comparison
+    if pet == "cat":                  # comparison
         print("Meow crew.")
     elif pet == "dog":
         print("Woof pack.")